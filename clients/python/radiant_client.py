@@ -17,8 +17,217 @@ Requirements:
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Union
+import copy
+import functools
+import sys as _sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # pragma: no cover - optional brotli support
+    import brotli  # noqa: F401
+
+    _HAS_BROTLI = True
+except ImportError:
+    _HAS_BROTLI = False
+
+try:  # pragma: no cover - optional zstd support (urllib3 >= 2 decodes it)
+    import zstandard  # noqa: F401
+    import urllib3
+
+    _HAS_ZSTD = int(urllib3.__version__.split(".")[0]) >= 2
+except Exception:
+    _HAS_ZSTD = False
+
+try:  # pragma: no cover - optional HTTP/2 transport
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional streaming JSON parser
+    import ijson
+except ImportError:
+    ijson = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional fast JSON path
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional fast JSON encoder
+    import msgspec.json
+
+    # One reusable Encoder amortizes its setup cost across every POST.
+    _msgspec_encode = msgspec.json.Encoder().encode
+except ImportError:
+    _msgspec_encode = None
+import json as _stdlib_json
+
+
+def _accept_encoding() -> str:
+    """Advertise exactly the encodings urllib3 can decode transparently.
+
+    UTXO/history payloads compress 5-10x; listing an encoding we cannot
+    decode would hand callers raw compressed bytes, so each one is gated
+    on its decoder being importable.
+    """
+    encodings = ["gzip", "deflate"]
+    if _HAS_BROTLI:
+        encodings.append("br")
+    if _HAS_ZSTD:
+        encodings.append("zstd")
+    return ", ".join(encodings)
+
+
+_ACCEPT_ENCODING = _accept_encoding()
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse a JSON response body, preferring orjson's SIMD decoder.
+
+    Large payloads (whale-address UTXO sets, deep histories) are parse-bound;
+    orjson goes bytes->dict without an intermediate str decode.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return _stdlib_json.loads(data)
+
+
+def _error_detail(raw: bytes) -> str:
+    """Extract an error detail from a response body, decoding it only once."""
+    try:
+        detail = _json_loads(raw).get("detail")
+        if detail is not None:
+            return detail
+    except Exception:
+        pass
+    return raw.decode("utf-8", "replace")
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize a JSON request body: msgspec, then orjson, then stdlib."""
+    if _msgspec_encode is not None:
+        return _msgspec_encode(obj)
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return _stdlib_json.dumps(obj).encode("utf-8")
+
+
+# Path prefixes for the hot lookup endpoints, hoisted so the getters build
+# paths with a single concatenation instead of re-evaluating an f-string
+# template per call.
+_P_BLOCK = "/block/"
+_P_TX = "/tx/"
+_P_ADDRESS = "/address/"
+_P_TOKEN = "/token/"
+
+
+# Indexing workloads revisit the same txids/addresses constantly (inputs of
+# one tx are outputs of another). Memoizing the built paths, keyed by
+# interned identifiers, turns the repeat concatenations into dict hits and
+# lets the response-cache keys share one str object per identifier.
+@functools.lru_cache(maxsize=4096)
+def _tx_path(txid: str, suffix: str = "") -> str:
+    return _P_TX + txid + suffix
+
+
+@functools.lru_cache(maxsize=4096)
+def _address_path(address: str, suffix: str = "") -> str:
+    return _P_ADDRESS + address + suffix
+
+
+@functools.lru_cache(maxsize=4096)
+def _token_path(ref: str, suffix: str = "") -> str:
+    return _P_TOKEN + ref + suffix
+
+
+# Per-endpoint cache TTLs in seconds, matched by path prefix. Confirmed
+# blocks/transactions and token metadata are immutable, so they get a long
+# TTL; /chain and /fee change block-to-block and get short ones. The /tx/
+# TTL only applies once a response shows the tx confirmed (see
+# _effective_ttl); headers near the tip can be replaced by a reorg, so
+# callers tracking the tip should invalidate("/block/") when it moves.
+_CACHE_TTL: Dict[str, float] = {
+    "/block/": 86400,
+    "/tx/": 86400,
+    "/protocols": 3600,
+    "/chain": 2,
+    "/fee": 10,
+}
+
+# Mempool transactions confirm (and confirmed ones keep counting), so an
+# unconfirmed /tx/ response only gets a /chain-scale TTL.
+_UNCONFIRMED_TX_TTL = 2.0
+
+
+def _cache_ttl_for(path: str) -> Optional[float]:
+    for prefix, ttl in _CACHE_TTL.items():
+        if path.startswith(prefix):
+            return ttl
+    if path.startswith("/token/") and path.endswith("/metadata"):
+        return 86400
+    return None
+
+
+def _effective_ttl(path: str, ttl: float, result: Any) -> float:
+    """Shorten the TTL when the fetched response is not actually immutable.
+
+    /tx/ responses proxy ElectrumX's verbose transaction.get: a mempool tx
+    has no blockhash yet and will confirm, so freezing it for 24h would hide
+    the confirmation from pollers. Only a visibly confirmed tx earns the
+    long TTL.
+    """
+    if path.startswith(_P_TX) and isinstance(result, dict):
+        confirmed = result.get("blockhash") or result.get("confirmations", 0) >= 1
+        if not confirmed:
+            return _UNCONFIRMED_TX_TTL
+    return ttl
+
+
+class _TTLCache:
+    """Minimal TTL + LRU cache (avoids a cachetools dependency).
+
+    A single lock guards every access: instances are shared across threads
+    (thread-pool fan-outs, the default_client() singleton), and an unlocked
+    get() racing set()'s eviction can move_to_end a just-popped key.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if time.monotonic() >= expires:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, path_prefix: Optional[str] = None) -> None:
+        with self._lock:
+            if path_prefix is None:
+                self._data.clear()
+                return
+            for key in [k for k in self._data if k[0].startswith(path_prefix)]:
+                del self._data[key]
 
 
 class RadiantAPIError(Exception):
@@ -30,20 +239,149 @@ class RadiantAPIError(Exception):
         super().__init__(f"HTTP {status_code}: {detail}")
 
 
+_TRANSPORT_ERRORS: Tuple[type, ...] = (requests.RequestException,)
+if httpx is not None:
+    _TRANSPORT_ERRORS = _TRANSPORT_ERRORS + (httpx.HTTPError,)
+
+
+# Endpoints commonly hit in tight polling loops; when one keeps failing,
+# a circuit breaker fails the poll fast instead of having every tick eat a
+# full connect timeout plus the adapter's retries.
+_POLL_PREFIXES = ("/chain", "/fee", "/health")
+
+
+class _CircuitBreaker:
+    """Opens after consecutive failures, with exponential cooldown.
+
+    State is guarded by a lock: breakers live on clients shared across
+    threads, and racing failure counts would skew when the circuit trips.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        base_cooldown: float = 1.0,
+        max_cooldown: float = 60.0,
+    ):
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self.failures = 0
+        self.open_until = 0.0
+        self._lock = threading.Lock()
+
+    def check(self, path: str) -> None:
+        with self._lock:
+            remaining = self.open_until - time.monotonic()
+        if remaining > 0:
+            raise RadiantAPIError(
+                503, f"circuit open for {path}; retry in {remaining:.1f}s"
+            )
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.open_until = 0.0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                cooldown = min(
+                    self.base_cooldown
+                    * 2 ** (self.failures - self.failure_threshold),
+                    self.max_cooldown,
+                )
+                self.open_until = time.monotonic() + cooldown
+
+
 class RadiantClient:
     """Typed Python client for the Radiant Blockchain REST API."""
 
     def __init__(
         self,
         base_url: str = "http://localhost:3080/api",
-        timeout: int = 30,
+        timeout: Union[float, Tuple[float, float]] = (5.0, 30.0),
         headers: Optional[Dict[str, str]] = None,
+        http2: bool = False,
     ):
+        """``timeout`` is either one global limit or a (connect, read) pair.
+
+        Separate stages mean a dead host fails fast (connect) without
+        capping how long a large UTXO/history body may take to arrive
+        (read).
+        """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self.session = requests.Session()
-        if headers:
-            self.session.headers.update(headers)
+        self.http2 = http2
+        if http2:
+            if httpx is None:
+                raise ImportError(
+                    "http2=True requires httpx: pip install 'httpx[http2]'"
+                )
+            if isinstance(timeout, tuple):
+                connect, read = timeout
+                self.timeout = httpx.Timeout(
+                    connect=connect, read=read, write=read, pool=connect
+                )
+        self._headers = dict(headers) if headers else {}
+        # Session (and with it TLS context setup) is built on first request,
+        # so constructing a client stays free for callers that never hit
+        # the network on some code paths.
+        self._session: Any = None
+        self._session_lock = threading.Lock()
+        self._cache = _TTLCache(maxsize=4096)
+        self._breakers: Dict[str, _CircuitBreaker] = {}
+
+    def _breaker_for(self, path: str) -> Optional[_CircuitBreaker]:
+        for prefix in _POLL_PREFIXES:
+            if path.startswith(prefix):
+                breaker = self._breakers.get(prefix)
+                if breaker is None:
+                    breaker = self._breakers.setdefault(prefix, _CircuitBreaker())
+                return breaker
+        return None
+
+    @property
+    def session(self) -> Any:
+        """The underlying HTTP session, created lazily and double-checked
+        under a lock so one instance is safely shared across threads."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._build_session()
+        return self._session
+
+    def _build_session(self) -> Any:
+        if self.http2:
+            # httpx multiplexes requests over one HTTP/2 connection and
+            # negotiates gzip/br/zstd itself based on installed decoders.
+            session = httpx.Client(http2=True)
+            session.headers.update(self._headers)
+            return session
+        session = requests.Session()
+        # Stock Session defaults (pool_connections=10, pool_maxsize=10, no
+        # retries) drop connections under concurrent txid/address lookups
+        # against a single host, forcing fresh TCP+TLS handshakes. Mount a
+        # larger pool with retry/backoff so connections are reused.
+        adapter = HTTPAdapter(
+            pool_connections=100,
+            pool_maxsize=1000,
+            # Idempotent methods only (urllib3's default): auto-retrying a
+            # POST /tx whose response was lost would re-broadcast a
+            # transaction that may already have been accepted.
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+            ),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["Connection"] = "keep-alive"
+        session.headers["Accept-Encoding"] = _ACCEPT_ENCODING
+        session.headers.update(self._headers)
+        return session
 
     def _request(
         self,
@@ -52,25 +390,109 @@ class RadiantClient:
         params: Optional[Dict[str, Any]] = None,
         json_body: Optional[Dict[str, Any]] = None,
     ) -> Any:
-        url = f"{self.base_url}{path}"
-        resp = self.session.request(
-            method, url, params=params, json=json_body, timeout=self.timeout
-        )
-        if not resp.ok:
-            detail = resp.text
-            try:
-                detail = resp.json().get("detail", resp.text)
-            except Exception:
-                pass
-            raise RadiantAPIError(resp.status_code, detail)
-        return resp.json()
+        url = self.base_url + path
+        breaker = self._breaker_for(path)
+        if breaker is not None:
+            breaker.check(path)
+        body = None
+        req_headers = None
+        if json_body is not None:
+            # Pre-serialized bytes skip requests' stdlib json.dumps.
+            body = _json_dumps(json_body)
+            req_headers = {"Content-Type": "application/json"}
+        try:
+            if self.http2:
+                resp = self.session.request(
+                    method,
+                    url,
+                    params=params,
+                    content=body,
+                    headers=req_headers,
+                    timeout=self.timeout,
+                )
+            else:
+                resp = self.session.request(
+                    method,
+                    url,
+                    params=params,
+                    data=body,
+                    headers=req_headers,
+                    timeout=self.timeout,
+                )
+        except _TRANSPORT_ERRORS:
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+        if breaker is not None:
+            if resp.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+        if not 200 <= resp.status_code < 300:
+            raise RadiantAPIError(resp.status_code, _error_detail(resp.content))
+        return _json_loads(resp.content)
+
+    def _get(self, path: str, **params: Any) -> Any:
+        # Query params arrive flattened as kwargs; None values mean "omit",
+        # so optional params can be passed unconditionally by callers.
+        if params:
+            params = {k: v for k, v in params.items() if v is not None}
+        ttl = _cache_ttl_for(path)
+        if ttl is None:
+            return self._request("GET", path, params=params or None)
+        key = (path, tuple(sorted(params.items())))
+        cached = self._cache.get(key)
+        if cached is None:
+            cached = self._request("GET", path, params=params or None)
+            self._cache.set(key, cached, _effective_ttl(path, ttl, cached))
+        # Deep-copied so callers can mutate results without poisoning the cache.
+        return copy.deepcopy(cached)
 
-    def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
-        return self._request("GET", path, params=params)
+    def invalidate(self, path_prefix: Optional[str] = None) -> None:
+        """Drop cached responses, optionally only those under a path prefix."""
+        self._cache.invalidate(path_prefix)
+
+    def _iter_items(
+        self, path: str, items_path: str, **params: Any
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream array items from a large response without buffering it.
+
+        Parses the response incrementally with ijson so a whale-address
+        UTXO set or deep history never materializes as one giant dict.
+        """
+        if params:
+            params = {k: v for k, v in params.items() if v is not None}
+        if self.http2 or ijson is None:
+            # Without ijson (or on the httpx transport, which exposes no raw
+            # file object) degrade to a buffered parse of the same items.
+            data = self._request("GET", path, params=params or None)
+            yield from data.get(items_path.split(".", 1)[0], [])
+            return
+        url = self.base_url + path
+        resp = self.session.get(
+            url, params=params or None, timeout=self.timeout, stream=True
+        )
+        if not 200 <= resp.status_code < 300:
+            raise RadiantAPIError(resp.status_code, _error_detail(resp.content))
+        resp.raw.decode_content = True  # transparent decompression on the stream
+        try:
+            yield from ijson.items(resp.raw, items_path)
+        finally:
+            resp.close()
 
     def _post(self, path: str, json_body: Optional[Dict[str, Any]] = None) -> Any:
         return self._request("POST", path, json_body=json_body)
 
+    def batch(self, max_workers: int = 8) -> "RadiantBatch":
+        """Create a batch that dispatches queued calls in one round trip.
+
+        Usage:
+            with client.batch() as b:
+                futures = [b.add("get_transaction", txid) for txid in txids]
+            results = [f.result() for f in futures]
+        """
+        return RadiantBatch(self, max_workers=max_workers)
+
     # =========================================================================
     # Blockchain
     # =========================================================================
@@ -81,23 +503,39 @@ class RadiantClient:
 
     def get_block_header(self, height: int) -> Dict[str, Any]:
         """Get block header by height."""
-        return self._get(f"/block/{height}")
+        return self._get(_P_BLOCK + str(height))
 
     def get_transaction(self, txid: str) -> Dict[str, Any]:
         """Get transaction details by txid."""
-        return self._get(f"/tx/{txid}")
+        return self._get(_tx_path(_sys.intern(txid)))
+
+    def get_many_transactions(
+        self, txids: List[str], max_workers: int = 8
+    ) -> List[Dict[str, Any]]:
+        """Fetch many transactions concurrently, preserving txid order.
+
+        Lookups run on a thread pool over the shared pooled session, so N
+        txids cost roughly one round-trip window instead of N; txids
+        already in the response cache are served without a request.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(self.get_transaction, txids))
 
     def decode_transaction(self, txid: str) -> Dict[str, Any]:
         """Decode a transaction (verbose)."""
-        return self._get(f"/tx/{txid}/decode")
+        return self._get(_tx_path(_sys.intern(txid), "/decode"))
 
     def broadcast_transaction(self, raw_tx: str) -> Dict[str, Any]:
         """Broadcast a signed raw transaction."""
-        return self._post("/tx", {"raw_tx": raw_tx})
+        result = self._post("/tx", {"raw_tx": raw_tx})
+        # A new mempool entry shifts chain state and fee estimates.
+        self.invalidate("/chain")
+        self.invalidate("/fee")
+        return result
 
     def estimate_fee(self, blocks: int = 6) -> Dict[str, Any]:
         """Estimate transaction fee for confirmation within N blocks."""
-        return self._get("/fee", {"blocks": blocks})
+        return self._get("/fee", blocks=blocks)
 
     # =========================================================================
     # Address
@@ -105,19 +543,36 @@ class RadiantClient:
 
     def get_balance(self, address: str) -> Dict[str, Any]:
         """Get RXD balance for an address (confirmed + unconfirmed)."""
-        return self._get(f"/address/{address}/balance")
+        return self._get(_address_path(_sys.intern(address), "/balance"))
+
+    def get_many_balances(
+        self, addresses: List[str], max_workers: int = 8
+    ) -> List[Dict[str, Any]]:
+        """Fetch balances for many addresses concurrently, preserving order."""
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(self.get_balance, addresses))
 
     def get_utxos(self, address: str) -> Dict[str, Any]:
         """List unspent outputs for an address."""
-        return self._get(f"/address/{address}/utxos")
+        return self._get(_address_path(_sys.intern(address), "/utxos"))
 
     def get_history(self, address: str) -> Dict[str, Any]:
         """Get transaction history for an address."""
-        return self._get(f"/address/{address}/history")
+        return self._get(_address_path(_sys.intern(address), "/history"))
+
+    def iter_utxos(self, address: str) -> Iterator[Dict[str, Any]]:
+        """Stream unspent outputs for an address one item at a time."""
+        return self._iter_items(_address_path(_sys.intern(address), "/utxos"), "utxos.item")
+
+    def iter_history(self, address: str) -> Iterator[Dict[str, Any]]:
+        """Stream transaction history for an address one item at a time."""
+        return self._iter_items(
+            _address_path(_sys.intern(address), "/history"), "transactions.item"
+        )
 
     def list_tokens(self, address: str, limit: int = 100) -> Dict[str, Any]:
         """List Glyph tokens held by an address."""
-        return self._get(f"/address/{address}/tokens", {"limit": limit})
+        return self._get(_address_path(_sys.intern(address), "/tokens"), limit=limit)
 
     # =========================================================================
     # Glyph Tokens
@@ -125,17 +580,35 @@ class RadiantClient:
 
     def get_token(self, ref: str) -> Dict[str, Any]:
         """Get Glyph token info by reference (txid_vout)."""
-        return self._get(f"/token/{ref}")
+        return self._get(_token_path(_sys.intern(ref)))
+
+    def get_many_tokens(
+        self, refs: List[str], max_workers: int = 8
+    ) -> List[Dict[str, Any]]:
+        """Fetch many tokens concurrently, preserving ref order."""
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(self.get_token, refs))
 
     def get_token_metadata(self, ref: str) -> Dict[str, Any]:
         """Get full CBOR metadata for a token."""
-        return self._get(f"/token/{ref}/metadata")
+        return self._get(_token_path(_sys.intern(ref), "/metadata"))
 
     def get_token_history(
         self, ref: str, limit: int = 100, offset: int = 0
     ) -> Dict[str, Any]:
         """Get transaction history for a token."""
-        return self._get(f"/token/{ref}/history", {"limit": limit, "offset": offset})
+        return self._get(_token_path(_sys.intern(ref), "/history"), limit=limit, offset=offset)
+
+    def iter_token_history(
+        self, ref: str, limit: int = 100, offset: int = 0
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream transaction history for a token one item at a time."""
+        return self._iter_items(
+            _token_path(_sys.intern(ref), "/history"),
+            "history.item",
+            limit=limit,
+            offset=offset,
+        )
 
     def search_tokens(
         self,
@@ -144,18 +617,15 @@ class RadiantClient:
         limit: int = 50,
     ) -> Dict[str, Any]:
         """Search tokens by name or ticker."""
-        params: Dict[str, Any] = {"q": query, "limit": limit}
-        if protocols:
-            params["protocols"] = protocols
-        return self._get("/tokens/search", params)
+        return self._get(
+            "/tokens/search", q=query, limit=limit, protocols=protocols or None
+        )
 
     def get_tokens_by_type(
         self, type_id: int, limit: int = 100, offset: int = 0
     ) -> Dict[str, Any]:
         """List tokens by type (1=FT, 2=NFT, 3=DAT, 4=dMint, etc.)."""
-        return self._get(
-            f"/tokens/type/{type_id}", {"limit": limit, "offset": offset}
-        )
+        return self._get(f"/tokens/type/{type_id}", limit=limit, offset=offset)
 
     # =========================================================================
     # dMint
@@ -163,7 +633,7 @@ class RadiantClient:
 
     def get_dmint_contracts(self, format: str = "extended") -> Any:
         """List active dMint contracts."""
-        return self._get("/dmint/contracts", {"format": format})
+        return self._get("/dmint/contracts", format=format)
 
     def get_dmint_contract(self, ref: str) -> Dict[str, Any]:
         """Get dMint contract details by reference."""
@@ -175,7 +645,7 @@ class RadiantClient:
 
     def get_most_profitable_dmint(self, limit: int = 10) -> Any:
         """Get most profitable dMint contracts sorted by reward/difficulty."""
-        return self._get("/dmint/profitable", {"limit": limit})
+        return self._get("/dmint/profitable", limit=limit)
 
     # =========================================================================
     # WAVE Naming
@@ -193,9 +663,7 @@ class RadiantClient:
         self, name: str, limit: int = 100, offset: int = 0
     ) -> Dict[str, Any]:
         """List subdomains of a WAVE name."""
-        return self._get(
-            f"/wave/{name}/subdomains", {"limit": limit, "offset": offset}
-        )
+        return self._get(f"/wave/{name}/subdomains", limit=limit, offset=offset)
 
     def get_wave_stats(self) -> Dict[str, Any]:
         """Get WAVE naming system statistics."""
@@ -214,17 +682,14 @@ class RadiantClient:
     ) -> Dict[str, Any]:
         """Get open swap orders for a trading pair."""
         return self._get(
-            "/swap/orders",
-            {"sell": sell, "buy": buy, "limit": limit, "offset": offset},
+            "/swap/orders", sell=sell, buy=buy, limit=limit, offset=offset
         )
 
     def get_swap_history(
         self, ref: str, limit: int = 100, offset: int = 0
     ) -> Dict[str, Any]:
         """Get trade history for a token."""
-        return self._get(
-            "/swap/history", {"ref": ref, "limit": limit, "offset": offset}
-        )
+        return self._get("/swap/history", ref=ref, limit=limit, offset=offset)
 
     # =========================================================================
     # Utility
@@ -354,8 +819,7 @@ class RadiantClient:
     ) -> Dict[str, Any]:
         """Check token-gated service access."""
         return self._get(
-            f"/access/check/{address}/{token_ref}",
-            {"min_balance": min_balance},
+            f"/access/check/{address}/{token_ref}", min_balance=min_balance
         )
 
     def open_channel(
@@ -446,7 +910,144 @@ class RadiantClient:
         limit: int = 50,
     ) -> Dict[str, Any]:
         """Search the data marketplace."""
-        params: Dict[str, Any] = {"q": query, "limit": limit}
-        if asset_type:
-            params["type"] = asset_type
-        return self._get("/marketplace/search", params)
+        return self._get(
+            "/marketplace/search", q=query, limit=limit, type=asset_type or None
+        )
+
+
+_default_client: Optional[RadiantClient] = None
+_default_client_lock = threading.Lock()
+
+
+def default_client() -> RadiantClient:
+    """Process-wide shared client with default settings.
+
+    Threads that share this instance also share its connection pool and
+    response cache, instead of each paying for their own Session and
+    TLS handshakes.
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = RadiantClient()
+    return _default_client
+
+
+class _BatchRecorder(RadiantClient):
+    """Captures the HTTP subrequest a client method call would issue.
+
+    Reuses the RadiantClient method bodies but replaces the transport with
+    a recorder, so batch helpers never have to duplicate the route table.
+    """
+
+    def __init__(self):  # no session / network setup
+        self._cache = _TTLCache(maxsize=0)  # recording must never hit the cache
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_body: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        sub: Dict[str, Any] = {"method": method, "path": path}
+        if params:
+            sub["params"] = params
+        if json_body is not None:
+            sub["body"] = json_body
+        return sub
+
+
+_recorder = _BatchRecorder()
+
+
+def _record_call(method_name: str, args: tuple, kwargs: dict) -> Dict[str, Any]:
+    """Resolve a client method name + arguments to its subrequest dict."""
+    method = getattr(_recorder, method_name, None)
+    if method is None or method_name.startswith("_"):
+        raise AttributeError(f"Unknown client method: {method_name}")
+    return method(*args, **kwargs)
+
+
+class RadiantBatch:
+    """Queues client calls and dispatches them in a single network round trip.
+
+    Each ``add()`` returns a :class:`concurrent.futures.Future` resolved on
+    ``execute()``. Dispatch first tries a single POST ``/batch`` with the
+    queued subrequests; servers without that endpoint fall back to a
+    thread-pool fan-out over the shared session.
+    """
+
+    def __init__(self, client: RadiantClient, max_workers: int = 8):
+        self._client = client
+        self._max_workers = max_workers
+        self._entries: List[Dict[str, Any]] = []
+        self._futures: List[Future] = []
+
+    def add(self, method_name: str, *args: Any, **kwargs: Any) -> Future:
+        """Queue a client call by method name; returns a Future for its result."""
+        self._entries.append(_record_call(method_name, args, kwargs))
+        future: Future = Future()
+        self._futures.append(future)
+        return future
+
+    def execute(self) -> List[Any]:
+        """Dispatch all queued calls and resolve their Futures in order.
+
+        Every handed-out Future is resolved before this returns or raises,
+        so waiters never block on a failed dispatch.
+        """
+        if not self._entries:
+            return []
+        try:
+            try:
+                results = self._client._post("/batch", {"requests": self._entries})
+                if isinstance(results, dict):
+                    results = results.get("results", results)
+                if len(results) != len(self._futures):
+                    raise RadiantAPIError(
+                        502,
+                        f"/batch returned {len(results)} results "
+                        f"for {len(self._futures)} subrequests",
+                    )
+                for future, result in zip(self._futures, results):
+                    future.set_result(result)
+            except RadiantAPIError as exc:
+                if exc.status_code not in (404, 405, 501):
+                    raise
+                self._execute_concurrent()
+            return [f.result() for f in self._futures]
+        except BaseException as exc:
+            for future in self._futures:
+                if not future.done():
+                    future.set_exception(exc)
+            raise
+        finally:
+            self._entries, self._futures = [], []
+
+    def _execute_concurrent(self) -> None:
+        # Fallback for servers without /batch: overlap the round trips
+        # on the shared (pooled) session instead of collapsing them.
+        def dispatch(entry: Dict[str, Any]) -> Any:
+            return self._client._request(
+                entry["method"],
+                entry["path"],
+                params=entry.get("params"),
+                json_body=entry.get("body"),
+            )
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            jobs = [pool.submit(dispatch, entry) for entry in self._entries]
+            for future, job in zip(self._futures, jobs):
+                try:
+                    future.set_result(job.result())
+                except Exception as exc:
+                    future.set_exception(exc)
+
+    def __enter__(self) -> "RadiantBatch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.execute()